@@ -1,7 +1,9 @@
 from flask import Flask
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
+from werkzeug.middleware.proxy_fix import ProxyFix
 from config import Config
+from utils.rate_limit import init_rate_limiting, init_load_shedding
 from routes.user_routes import user_bp
 from routes.task_routes import task_bp
 from routes.email_notifications import email_notifications_bp
@@ -10,6 +12,10 @@ from routes.status import status_bp    # <-- NEW IMPORT
 app = Flask(__name__)
 app.config.from_object(Config)
 
+# Trust X-Forwarded-For from our own proxies so remote_addr is the client
+if Config.TRUSTED_PROXY_HOPS:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=Config.TRUSTED_PROXY_HOPS)
+
 # ✅ Enable CORS for both localhost & Vercel
 CORS(app, origins=[
     "http://localhost:4200",
@@ -23,6 +29,11 @@ def handle_options():
     if request.method == 'OPTIONS':
         return '', 200
 
+init_rate_limiting(app)
+
+# Shed load before requests pile up inside gunicorn
+init_load_shedding(app)
+
 jwt = JWTManager(app)
 
 # Register blueprints
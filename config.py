@@ -16,3 +16,37 @@ class Config:
     # ✅ Extend JWT expiration (e.g., 1 day)
     JWT_SECRET_KEY = SECRET_KEY
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(days=1)
+
+    # Replayed responses for Idempotency-Key requests are kept this long
+    IDEMPOTENCY_TTL = timedelta(hours=24)
+    # The request holding a claim renews it every third of this while it
+    # runs; a claim not renewed for this long (worker died) may be taken over
+    IDEMPOTENCY_LOCK_TIMEOUT = timedelta(seconds=30)
+
+    # Per-endpoint token-bucket budgets: (requests, per seconds)
+    RATE_LIMITS = {
+        "login": (10, 60),
+        "register": (5, 300),
+        "resend_code": (3, 300),
+        "create_task": (20, 60),
+        "get_tasks": (60, 60),
+    }
+    # "memory" (per process: each gunicorn worker has its own buckets, so
+    # budgets scale with WEB_CONCURRENCY and reset on worker restart) or
+    # "mongo" (shared across workers/instances)
+    RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+
+    # Number of reverse proxies in front of the app whose X-Forwarded-For
+    # is trusted; rate limits key on the client IP they report. Off by
+    # default: without a proxy, clients could forge the header. Set it in
+    # the deployment environment (1 behind a single proxy).
+    TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "0"))
+
+    # Shed load with 503 once this many requests are in flight in a worker.
+    # Only gevent/eventlet workers ever have more than one in flight; sync
+    # workers rely on the queue-wait check below instead.
+    MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "100"))
+    # Shed requests that waited longer than this before reaching the app,
+    # measured from the proxy's X-Request-Start header (0 disables)
+    MAX_QUEUE_WAIT_MS = int(os.getenv("MAX_QUEUE_WAIT_MS", "0"))
+    LOAD_SHED_RETRY_AFTER = 5
@@ -0,0 +1,54 @@
+import os
+from config import Config
+
+# Gunicorn picks this file up automatically from the working directory:
+#   gunicorn app:app
+#
+# Sync mode (default) blocks one worker per request on Mongo/SMTP I/O.
+# For high-concurrency deployments switch to cooperative gevent workers:
+#   GUNICORN_WORKER_CLASS=gevent gunicorn app:app
+#
+# gevent mode is safe for this app as long as the app is NOT preloaded:
+# the gevent worker monkey-patches socket/ssl/threading after fork and only
+# then imports app.py, so every module-level MongoClient and every
+# smtplib.SMTP connection is created on patched, cooperative sockets.
+# PyMongo officially supports gevent with monkey-patching.
+
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "sync")
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Gunicorn's default of one worker unless WEB_CONCURRENCY says otherwise.
+# Each worker opens its own set of module-level MongoClients (4-5 pools), so
+# size this against the Mongo connection limit, not the host core count
+# (cpu_count() reports host cores inside containers). In gevent mode a single
+# worker per core is usually enough; sync mode needs more workers for the
+# same concurrency. With the default RATE_LIMIT_BACKEND=memory each worker
+# keeps its own rate-limit buckets, multiplying every budget by this count.
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# Max simultaneous connections per gevent/eventlet worker (ignored by sync).
+# Defaults to twice Config.MAX_CONCURRENT_REQUESTS: the app handles up to
+# that many requests at once and answers the surplus with an immediate 503
+# instead of leaving them in the listen backlog. Keep it above the shedding
+# cap, otherwise shedding never triggers.
+worker_connections = int(os.getenv(
+    "GUNICORN_WORKER_CONNECTIONS", 2 * Config.MAX_CONCURRENT_REQUESTS
+))
+
+# Keep MongoClient and SMTP connections out of the master process; see above.
+preload_app = False
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# Worker recycling is off (gunicorn's default); no leak calls for it. If it
+# is enabled, every restart reopens the MongoClient pools and, with the
+# default RATE_LIMIT_BACKEND=memory, resets every rate-limit bucket, so a
+# burst of cheap 429s would recycle the worker and refill its budgets.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "0"))
+
+accesslog = "-"
+errorlog = "-"
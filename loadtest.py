@@ -0,0 +1,167 @@
+"""Per-process concurrency load test for sync vs gevent gunicorn workers.
+
+The app is served with Mongo and SMTP replaced by in-memory stand-ins that
+sleep for a fixed latency, so the numbers reflect how many requests a single
+worker process can keep in flight while waiting on I/O, not database speed.
+
+Requires: pip install mongomock
+
+1) Start one worker in the mode under test (from the repo root):
+
+    GUNICORN_WORKER_CLASS=sync WEB_CONCURRENCY=1 gunicorn 'loadtest:create_app()'
+    GUNICORN_WORKER_CLASS=gevent WEB_CONCURRENCY=1 gunicorn 'loadtest:create_app()'
+
+2) In another shell, drive it:
+
+    python loadtest.py --concurrency 50 --duration 15
+
+Compare requests/sec and latency between the two runs. Injected latency is
+set on the server side with LOADTEST_MONGO_LATENCY_MS (default 20) and
+LOADTEST_SMTP_LATENCY_MS (default 300).
+"""
+import argparse
+import functools
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from bson import ObjectId
+from config import Config
+
+LOADTEST_USER_ID = ObjectId("000000000000000000000001")
+MONGO_LATENCY = int(os.getenv("LOADTEST_MONGO_LATENCY_MS", "20")) / 1000
+SMTP_LATENCY = int(os.getenv("LOADTEST_SMTP_LATENCY_MS", "300")) / 1000
+
+
+class _SlowSMTP:
+    def __init__(self, *args, **kwargs):
+        time.sleep(SMTP_LATENCY)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def _patch_backends():
+    import mongomock
+    import pymongo
+    import smtplib
+
+    def slow(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            time.sleep(MONGO_LATENCY)
+            return method(*args, **kwargs)
+        return wrapper
+
+    for name in ("find", "find_one", "insert_one", "update_one", "delete_one",
+                 "find_one_and_update", "count_documents"):
+        setattr(mongomock.collection.Collection, name,
+                slow(getattr(mongomock.collection.Collection, name)))
+
+    # Every module-level MongoClient must share one in-memory store
+    shared = mongomock.MongoClient()
+    pymongo.MongoClient = lambda *args, **kwargs: shared
+    smtplib.SMTP = _SlowSMTP
+    return shared
+
+
+def create_app():
+    """Gunicorn app factory serving the real app on latency-injected stubs."""
+    shared = _patch_backends()
+
+    # Budgets are per user; the load test reuses one user, so lift them
+    Config.RATE_LIMITS = {name: (10 ** 9, 1) for name in Config.RATE_LIMITS}
+    Config.RATE_LIMIT_BACKEND = "memory"
+
+    from app import app
+
+    db = shared.EmployeeManagement
+    db.users.insert_one({
+        "_id": LOADTEST_USER_ID,
+        "username": "loadtest",
+        "email": "loadtest@example.com",
+        "role": "Employee",
+        "employee_id": "TMS0001",
+        "is_verified": True
+    })
+    db.tasks.insert_many([{
+        "title": f"Task {i}",
+        "description": "load test",
+        "assigned_to": "TMS0001",
+        "priority": "Low",
+        "status": "Pending",
+        "deadline": "2099-01-01"
+    } for i in range(20)])
+    return app
+
+
+def _token():
+    from flask import Flask
+    from flask_jwt_extended import JWTManager, create_access_token
+
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    JWTManager(app)
+    with app.app_context():
+        return create_access_token(identity=str(LOADTEST_USER_ID))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--path", default="/api/tasks/")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=15)
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {_token()}"}
+    deadline = time.monotonic() + args.duration
+    latencies, statuses = [], Counter()
+    lock = threading.Lock()
+
+    def client():
+        while time.monotonic() < deadline:
+            req = urllib.request.Request(args.url + args.path, headers=headers)
+            start = time.monotonic()
+            try:
+                with urllib.request.urlopen(req, timeout=60) as resp:
+                    resp.read()
+                    status = resp.status
+            except urllib.error.HTTPError as e:
+                status = e.code
+            except OSError:
+                status = "error"
+            with lock:
+                latencies.append(time.monotonic() - start)
+                statuses[status] += 1
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        for _ in range(args.concurrency):
+            pool.submit(client)
+
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+    print(json.dumps({
+        "path": args.path,
+        "concurrency": args.concurrency,
+        "requests": len(latencies),
+        "requests_per_sec": round(len(latencies) / args.duration, 1),
+        "p50_ms": round(pct(0.50), 1) if latencies else None,
+        "p95_ms": round(pct(0.95), 1) if latencies else None,
+        "statuses": {str(k): v for k, v in statuses.items()}
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
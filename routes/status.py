@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from pymongo import MongoClient
 from bson import ObjectId
+from utils.idempotency import idempotent, begin_writes
 import os
 
 status_bp = Blueprint('status', __name__)
@@ -33,6 +34,7 @@ def status_summary():
 
 @status_bp.route('/update', methods=['POST'])
 @jwt_required()
+@idempotent
 def status_update():
     user_id = get_jwt_identity()
     current_user = db.users.find_one({"_id": ObjectId(user_id)})
@@ -48,5 +50,6 @@ def status_update():
     if not task:
         return jsonify({"msg": "Task not found or not assigned to you"}), 404
 
+    begin_writes()
     db.tasks.update_one({'_id': ObjectId(task_id)}, {'$set': {'status': new_status}})
     return jsonify({"msg": "Status updated"}), 200
@@ -3,6 +3,8 @@ from pymongo import MongoClient
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models.task import Task
 from utils.email_utils import send_email
+from utils.idempotency import idempotent, begin_writes
+from utils.rate_limit import rate_limited
 import os
 from bson import ObjectId
 from datetime import datetime
@@ -24,6 +26,8 @@ def send_assignment_notification(emails, title, deadline, body_extra=''):
 
 @task_bp.route('/create', methods=['POST'])
 @jwt_required()
+@rate_limited('create_task')
+@idempotent
 def create_task():
   user_id = get_jwt_identity()
   current_user = db.users.find_one({"_id": ObjectId(user_id)})
@@ -43,6 +47,7 @@ def create_task():
   if not employees:
       return jsonify({"msg": "Assigned user(s) must be valid employees."}), 400
 
+  begin_writes()
   for emp in employees:
       task = Task(
           data['title'], data['description'], emp['employee_id'],
@@ -64,6 +69,7 @@ def create_task():
 
 @task_bp.route('/update/<task_id>', methods=['PUT'])
 @jwt_required()
+@idempotent
 def update_task(task_id):
   user_id = get_jwt_identity()
   current_user = db.users.find_one({"_id": ObjectId(user_id)})
@@ -84,6 +90,7 @@ def update_task(task_id):
       new_status = data.get('status')
       if not new_status:
           return jsonify({"msg": "Nothing to update"}), 400
+      begin_writes()
       db.tasks.update_one({'_id': ObjectId(task_id)}, {'$set': {'status': new_status}})
 
       # Notify managers/admins when status becomes "In Progress" or "Done"
@@ -109,12 +116,14 @@ def update_task(task_id):
 
   # Admin/Manager can update full task
   else:
+      begin_writes()
       db.tasks.update_one({'_id': ObjectId(task_id)}, {'$set': data})
       return jsonify({"msg": "Task updated"}), 200
 
 
 @task_bp.route('/complete/<task_id>', methods=['POST'])
 @jwt_required()
+@idempotent
 def complete_task(task_id):
   user_id = get_jwt_identity()
   current_user = db.users.find_one({"_id": ObjectId(user_id)})
@@ -126,6 +135,7 @@ def complete_task(task_id):
       return jsonify({"msg": "Not authorized for this task."}), 403
 
   # Set status to Done
+  begin_writes()
   db.tasks.update_one({'_id': ObjectId(task_id)}, {'$set': {'status': 'Done'}})
 
   # Notify managers/admins of submission
@@ -173,6 +183,7 @@ def delete_task(task_id):
 
 @task_bp.route('/', methods=['GET'])
 @jwt_required()
+@rate_limited('get_tasks')
 def get_tasks():
   user_id = get_jwt_identity()
   current_user = db.users.find_one({"_id": ObjectId(user_id)})
@@ -208,6 +219,7 @@ def get_task(task_id):
 # NEW: Mark overdue and notify Admin/Manager
 @task_bp.route('/mark-overdue/<task_id>', methods=['POST'])
 @jwt_required()
+@idempotent
 def mark_overdue(task_id):
   user_id = get_jwt_identity()
   current_user = db.users.find_one({"_id": ObjectId(user_id)})
@@ -224,6 +236,7 @@ def mark_overdue(task_id):
   already_overdue = (task.get('status') == 'Overdue')
 
   # Mark as Overdue
+  begin_writes()
   db.tasks.update_one({'_id': ObjectId(task_id)}, {'$set': {'status': 'Overdue'}})
 
   if not already_overdue:
@@ -5,6 +5,7 @@ from flask import Blueprint, request, jsonify
 from pymongo import MongoClient
 from flask_jwt_extended import create_access_token, jwt_required
 from models.user import User
+from utils.rate_limit import rate_limited
 from bson import ObjectId
 import os
 import smtplib
@@ -68,6 +69,7 @@ def user_detail(user_id):
 
 # ✅ Register with rules
 @user_bp.route('/register', methods=['POST'])
+@rate_limited('register')
 def register():
     data = request.json
 
@@ -145,6 +147,7 @@ def verify_email():
 
 # ✅ Resend Code
 @user_bp.route('/resend-code', methods=['POST'])
+@rate_limited('resend_code', per_field='email')
 def resend_code():
     data = request.json
     user = db.users.find_one({"email": data['email']})
@@ -169,6 +172,7 @@ def resend_code():
 
 # ✅ Login → only allowed if verified
 @user_bp.route('/login', methods=['POST'])
+@rate_limited('login', per_field='email')
 def login():
     data = request.json
     user = db.users.find_one({"email": data['email']})
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The real MONGO_URI in .env is an SRV URI that needs DNS at import time;
+# tests never reach Mongo, so point clients at a lazy local URI instead
+# (load_dotenv does not override variables that are already set).
+os.environ["MONGO_URI"] = "mongodb://localhost:27017"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
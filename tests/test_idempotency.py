@@ -0,0 +1,174 @@
+import threading
+from datetime import datetime, timedelta
+
+import mongomock
+import pytest
+from flask import Flask, jsonify, request
+from flask_jwt_extended import JWTManager, create_access_token, jwt_required
+
+from config import Config
+from utils import idempotency
+from utils.idempotency import idempotent, begin_writes
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    coll = mongomock.MongoClient().EmployeeManagement.idempotency_keys
+    monkeypatch.setattr(idempotency, "_idempotency_collection", coll)
+    monkeypatch.setattr(idempotency, "_index_ready", False)
+    return coll
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def client(collection, calls):
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = "test-secret-key-of-reasonable-length"
+    JWTManager(app)
+
+    @app.route("/create", methods=["POST"])
+    @jwt_required()
+    @idempotent
+    def create():
+        calls.append(request.json)
+        return jsonify({"n": len(calls)}), 201
+
+    @app.route("/fail", methods=["POST"])
+    @jwt_required()
+    @idempotent
+    def fail():
+        calls.append(request.json)
+        return jsonify({"msg": "boom"}), 500
+
+    @app.route("/fail-after-write", methods=["POST"])
+    @jwt_required()
+    @idempotent
+    def fail_after_write():
+        begin_writes()
+        calls.append(request.json)
+        raise RuntimeError("SMTP down")
+
+    with app.app_context():
+        token = create_access_token(identity="user-1")
+    test_client = app.test_client()
+    test_client.headers = {"Authorization": f"Bearer {token}"}
+    return test_client
+
+
+def post(client, path, key, body):
+    headers = dict(client.headers, **{"Idempotency-Key": key})
+    return client.post(path, json=body, headers=headers)
+
+
+def test_retry_replays_original_response(client, calls):
+    first = post(client, "/create", "k1", {"title": "a"})
+    second = post(client, "/create", "k1", {"title": "a"})
+
+    assert first.status_code == second.status_code == 201
+    assert second.get_json() == first.get_json() == {"n": 1}
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert len(calls) == 1
+
+
+def test_different_keys_run_separately(client, calls):
+    post(client, "/create", "k1", {"title": "a"})
+    post(client, "/create", "k2", {"title": "a"})
+    assert len(calls) == 2
+
+
+def test_reused_key_with_different_body_is_rejected(client, calls):
+    post(client, "/create", "k1", {"title": "a"})
+    resp = post(client, "/create", "k1", {"title": "b"})
+    assert resp.status_code == 422
+    assert len(calls) == 1
+
+
+def test_in_progress_claim_returns_409(client, collection, calls):
+    post(client, "/create", "k1", {"title": "a"})
+    collection.update_many({}, {"$set": {"completed": False, "locked_at": datetime.utcnow()}})
+
+    resp = post(client, "/create", "k1", {"title": "a"})
+    assert resp.status_code == 409
+    assert len(calls) == 1
+
+
+def test_stale_claim_is_taken_over(client, collection, calls):
+    post(client, "/create", "k1", {"title": "a"})
+    stale = datetime.utcnow() - Config.IDEMPOTENCY_LOCK_TIMEOUT - timedelta(seconds=1)
+    collection.update_many({}, {"$set": {"completed": False, "locked_at": stale}})
+
+    resp = post(client, "/create", "k1", {"title": "a"})
+    assert resp.status_code == 201
+    assert resp.get_json() == {"n": 2}
+    assert collection.find_one()["completed"] is True
+
+
+def test_server_error_releases_key(client, collection, calls):
+    assert post(client, "/fail", "k1", {}).status_code == 500
+    assert collection.count_documents({}) == 0
+    assert post(client, "/fail", "k1", {}).status_code == 500
+    assert len(calls) == 2
+
+
+def test_worker_abort_releases_key(client, collection):
+    # gunicorn's sync worker raises SystemExit when it times out a request
+    @client.application.route("/abort", methods=["POST"])
+    @jwt_required()
+    @idempotent
+    def aborted():
+        raise SystemExit(1)
+
+    with pytest.raises(SystemExit):
+        post(client, "/abort", "k1", {})
+    assert collection.count_documents({}) == 0
+
+
+def test_requests_without_key_pass_through(client, collection, calls):
+    client.post("/create", json={}, headers=client.headers)
+    client.post("/create", json={}, headers=client.headers)
+    assert len(calls) == 2
+    assert collection.count_documents({}) == 0
+
+
+def test_failure_after_writes_is_replayed_not_rerun(client, collection, calls):
+    first = post(client, "/fail-after-write", "k1", {})
+    second = post(client, "/fail-after-write", "k1", {})
+
+    assert first.status_code == second.status_code == 500
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert len(calls) == 1
+
+
+def test_running_owner_keeps_claim_past_lock_timeout(client, collection, calls, monkeypatch):
+    monkeypatch.setattr(Config, "IDEMPOTENCY_LOCK_TIMEOUT", timedelta(seconds=0.3))
+    started, release = threading.Event(), threading.Event()
+
+    @client.application.route("/slow", methods=["POST"])
+    @jwt_required()
+    @idempotent
+    def slow():
+        begin_writes()
+        calls.append(request.json)
+        started.set()
+        release.wait(5)
+        return jsonify({"n": len(calls)}), 201
+
+    results = []
+    owner = threading.Thread(target=lambda: results.append(post(client, "/slow", "k1", {})))
+    owner.start()
+    assert started.wait(5)
+
+    # Well past the lock timeout, but the owner keeps renewing its claim
+    threading.Event().wait(1)
+    retry = post(client, "/slow", "k1", {})
+    release.set()
+    owner.join(5)
+
+    assert retry.status_code == 409
+    assert results[0].status_code == 201
+    assert len(calls) == 1
+    assert post(client, "/slow", "k1", {}).get_json() == {"n": 1}
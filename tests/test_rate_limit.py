@@ -0,0 +1,194 @@
+import logging
+import time
+
+import mongomock
+import pytest
+from flask import Flask
+
+from config import Config
+from utils import rate_limit
+from utils.rate_limit import (
+    MemoryBackend, MongoBackend, init_load_shedding, init_rate_limiting, set_backend
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", fake)
+    return fake
+
+
+def test_bucket_allows_capacity_then_reports_retry_after(clock):
+    backend = MemoryBackend()
+    results = [backend.take("k", 3, 0.5) for _ in range(4)]
+
+    assert [allowed for allowed, _ in results] == [True, True, True, False]
+    assert results[-1][1] == pytest.approx(2.0)
+
+
+def test_bucket_refills_at_rate_up_to_capacity(clock):
+    backend = MemoryBackend()
+    for _ in range(3):
+        backend.take("k", 3, 0.5)
+
+    clock.now += 1
+    allowed, retry_after = backend.take("k", 3, 0.5)
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+    clock.now += 2
+    assert backend.take("k", 3, 0.5)[0]
+
+    clock.now += 3600
+    assert [backend.take("k", 3, 0.5)[0] for _ in range(4)] == [True, True, True, False]
+
+
+def test_full_buckets_are_swept(clock):
+    backend = MemoryBackend()
+    backend.take("idle", 2, 1)
+    clock.now += MemoryBackend.SWEEP_INTERVAL
+    backend.take("fresh", 2, 1)
+
+    assert set(backend._buckets) == {"fresh"}
+
+
+@pytest.fixture
+def mongo_backend():
+    backend = MongoBackend()
+    backend._collection = mongomock.MongoClient().EmployeeManagement.rate_limits
+    return backend
+
+
+@pytest.fixture
+def wall_clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "time", fake)
+    return fake
+
+
+def test_mongo_bucket_allows_capacity_then_reports_retry_after(mongo_backend, wall_clock):
+    results = [mongo_backend.take("k", 2, 1) for _ in range(3)]
+
+    assert [allowed for allowed, _ in results] == [True, True, False]
+    assert results[-1][1] == pytest.approx(1.0)
+
+
+def test_mongo_bucket_refills_at_rate_up_to_capacity(mongo_backend, wall_clock):
+    for _ in range(2):
+        mongo_backend.take("k", 2, 0.5)
+
+    wall_clock.now += 1
+    allowed, retry_after = mongo_backend.take("k", 2, 0.5)
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+    wall_clock.now += 1
+    assert mongo_backend.take("k", 2, 0.5)[0]
+
+    wall_clock.now += 3600
+    assert [mongo_backend.take("k", 2, 0.5)[0] for _ in range(3)] == [True, True, False]
+
+
+def test_mongo_buckets_are_per_key(mongo_backend, wall_clock):
+    mongo_backend.take("a", 1, 1)
+    assert not mongo_backend.take("a", 1, 1)[0]
+    assert mongo_backend.take("b", 1, 1)[0]
+
+
+def test_memory_backend_with_several_workers_warns(monkeypatch, caplog):
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    monkeypatch.setattr(Config, "RATE_LIMIT_BACKEND", "memory")
+    with caplog.at_level(logging.WARNING):
+        init_rate_limiting(Flask(__name__))
+    assert "multiplied by 4" in caplog.text
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from app import app
+    from routes import user_routes
+
+    monkeypatch.setattr(user_routes, "db", mongomock.MongoClient().EmployeeManagement)
+    set_backend(MemoryBackend())
+    yield app.test_client()
+    set_backend(None)
+
+
+def login(client, email, ip, headers=None):
+    return client.post(
+        "/api/users/login",
+        json={"email": email, "password": "x"},
+        headers=headers,
+        environ_base={"REMOTE_ADDR": ip}
+    )
+
+
+def test_login_returns_429_with_retry_after(client):
+    budget, per_seconds = Config.RATE_LIMITS["login"]
+    for _ in range(budget):
+        assert login(client, "a@example.com", "10.0.0.1").status_code == 401
+
+    resp = login(client, "a@example.com", "10.0.0.1")
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == str(per_seconds // budget)
+
+
+def test_forged_forwarded_for_is_ignored_without_trusted_proxy(client):
+    budget, _ = Config.RATE_LIMITS["login"]
+    for i in range(budget):
+        login(client, f"user{i}@example.com", "10.0.0.1", {"X-Forwarded-For": f"1.2.3.{i}"})
+
+    resp = login(client, "other@example.com", "10.0.0.1", {"X-Forwarded-For": "9.9.9.9"})
+    assert resp.status_code == 429
+
+
+def test_clients_get_separate_buckets(client):
+    budget, _ = Config.RATE_LIMITS["login"]
+    for i in range(budget):
+        login(client, f"user{i}@example.com", "10.0.0.1")
+
+    assert login(client, "other@example.com", "10.0.0.1").status_code == 429
+    assert login(client, "other@example.com", "10.0.0.2").status_code == 401
+
+
+def test_login_is_also_limited_per_email_across_ips(client):
+    budget, _ = Config.RATE_LIMITS["login"]
+    for i in range(budget):
+        assert login(client, "Victim@example.com", f"10.0.1.{i}").status_code == 401
+
+    assert login(client, "victim@example.com", "10.0.2.1").status_code == 429
+
+
+def test_requests_queued_too_long_are_shed(client, monkeypatch):
+    monkeypatch.setattr(Config, "MAX_QUEUE_WAIT_MS", 500)
+    stale = f"t={int((time.time() - 2) * 1000)}"
+    fresh = f"t={int(time.time() * 1e6)}"
+
+    resp = client.post("/api/users/login", json={"email": "a@example.com"},
+                       headers={"X-Request-Start": stale})
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == str(Config.LOAD_SHED_RETRY_AFTER)
+
+    resp = client.post("/api/users/login", json={"email": "a@example.com", "password": "x"},
+                       headers={"X-Request-Start": fresh})
+    assert resp.status_code == 401
+
+
+def test_requests_over_concurrency_cap_are_shed(monkeypatch):
+    monkeypatch.setattr(Config, "MAX_CONCURRENT_REQUESTS", 0)
+    app = Flask(__name__)
+    init_load_shedding(app)
+    app.add_url_rule("/", view_func=lambda: "ok")
+
+    resp = app.test_client().get("/")
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == str(Config.LOAD_SHED_RETRY_AFTER)
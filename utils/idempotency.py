@@ -0,0 +1,148 @@
+import hashlib
+import threading
+import uuid
+from functools import wraps
+from datetime import datetime
+from flask import request, jsonify, make_response, Response, g
+from flask_jwt_extended import get_jwt_identity
+from pymongo import MongoClient, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from config import Config
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+_client = MongoClient(Config.MONGO_URI)
+_db = _client.EmployeeManagement
+_idempotency_collection = _db.idempotency_keys
+_index_ready = False
+
+
+def _ensure_ttl_index():
+    # Created lazily so importing the module does not hit Mongo
+    global _index_ready
+    if not _index_ready:
+        _idempotency_collection.create_index(
+            "created_at",
+            expireAfterSeconds=int(Config.IDEMPOTENCY_TTL.total_seconds())
+        )
+        _index_ready = True
+
+
+def _replay(doc):
+    resp = Response(doc["body"], status=doc["status_code"], mimetype=doc.get("mimetype"))
+    resp.headers["Idempotent-Replayed"] = "true"
+    return resp
+
+
+def _claim(doc_id, request_hash):
+    """Claim the key for this request; return (lock_id, response or None)."""
+    lock_id = uuid.uuid4().hex
+    now = datetime.utcnow()
+    try:
+        _idempotency_collection.insert_one({
+            "_id": doc_id,
+            "request_hash": request_hash,
+            "completed": False,
+            "lock_id": lock_id,
+            "locked_at": now,
+            "created_at": now
+        })
+        return lock_id, None
+    except DuplicateKeyError:
+        pass
+
+    existing = _idempotency_collection.find_one({"_id": doc_id})
+    if not existing:
+        # Expired between insert and lookup; treat as a fresh request
+        return _claim(doc_id, request_hash)
+    if existing.get("request_hash") != request_hash:
+        return None, (jsonify({"msg": "Idempotency-Key was already used with a different request body."}), 422)
+    if existing.get("completed"):
+        return None, _replay(existing)
+
+    # Take over a claim whose owner stopped renewing it (worker died)
+    taken = _idempotency_collection.find_one_and_update(
+        {"_id": doc_id, "completed": False, "locked_at": {"$lt": now - Config.IDEMPOTENCY_LOCK_TIMEOUT}},
+        {"$set": {"lock_id": lock_id, "locked_at": now}},
+        return_document=ReturnDocument.AFTER
+    )
+    if taken:
+        return lock_id, None
+    return None, (jsonify({"msg": "A request with this Idempotency-Key is still in progress."}), 409)
+
+
+def begin_writes():
+    """Mark that an @idempotent view is about to change data or send email.
+
+    From this point on a failure is stored and replayed like any other
+    response, so a retry cannot repeat writes that may already have happened.
+    Failures before this point release the key and the client may retry.
+    """
+    g._idempotency_writes_started = True
+
+
+def _renew_lock(doc_id, lock_id, stop):
+    # Runs beside the view (a greenlet under gevent) so a long request keeps
+    # its claim; it dies with the worker, letting a retry take over
+    while not stop.wait(Config.IDEMPOTENCY_LOCK_TIMEOUT.total_seconds() / 3):
+        _idempotency_collection.update_one(
+            {"_id": doc_id, "lock_id": lock_id, "completed": False},
+            {"$set": {"locked_at": datetime.utcnow()}}
+        )
+
+
+def _store(owned, resp):
+    _idempotency_collection.update_one(owned, {"$set": {
+        "completed": True,
+        "status_code": resp.status_code,
+        "mimetype": resp.mimetype,
+        "body": resp.get_data(as_text=True)
+    }})
+
+
+def idempotent(view):
+    """Replay the stored response when a request repeats its Idempotency-Key.
+
+    Must be applied below @jwt_required() so keys are scoped per user. Views
+    call begin_writes() before their first write. Requests without the
+    header are passed through untouched.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view(*args, **kwargs)
+
+        _ensure_ttl_index()
+        doc_id = f"{get_jwt_identity()}:{request.method}:{request.path}:{key}"
+        request_hash = hashlib.sha256(request.get_data()).hexdigest()
+
+        # Claim the key first so concurrent retries cannot both run the write
+        lock_id, early_response = _claim(doc_id, request_hash)
+        if early_response is not None:
+            return early_response
+
+        # Only the current lock holder may complete or release the claim
+        owned = {"_id": doc_id, "lock_id": lock_id, "completed": False}
+        stop = threading.Event()
+        threading.Thread(target=_renew_lock, args=(doc_id, lock_id, stop), daemon=True).start()
+        resp = None
+        try:
+            resp = make_response(view(*args, **kwargs))
+        except BaseException:
+            # Also reached on SystemExit from gunicorn's worker abort
+            resp = make_response(
+                jsonify({"msg": "Request failed; retrying with this Idempotency-Key will not repeat it."}), 500
+            )
+            raise
+        finally:
+            stop.set()
+            writes_started = g.pop("_idempotency_writes_started", False)
+            if resp.status_code >= 500 and not writes_started:
+                # Nothing was written yet, so the client can safely retry
+                _idempotency_collection.delete_one(owned)
+            else:
+                _store(owned, resp)
+        return resp
+
+    return wrapper
@@ -0,0 +1,197 @@
+import math
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from functools import wraps
+from flask import request, jsonify, g
+from flask_jwt_extended import get_jwt_identity
+from pymongo import MongoClient, ReturnDocument
+from config import Config
+
+
+class MemoryBackend:
+    """Token buckets held in this process only."""
+
+    # Fully refilled buckets are dropped at most this often
+    SWEEP_INTERVAL = 60
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+    def take(self, key, capacity, rate):
+        """Consume one token; return (allowed, seconds until next token)."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep >= self.SWEEP_INTERVAL:
+                self._sweep(now)
+            tokens, ts, _ = self._buckets.get(key, (capacity, now, now))
+            tokens = min(capacity, tokens + (now - ts) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            # Remember when the bucket will be full again so it can be dropped
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+        return allowed, 0 if allowed else (1 - tokens) / rate
+
+    def _sweep(self, now):
+        # A full bucket is indistinguishable from a missing one
+        self._buckets = {k: v for k, v in self._buckets.items() if v[2] > now}
+        self._last_sweep = now
+
+
+class MongoBackend:
+    """Token buckets shared through Mongo, updated atomically per request."""
+
+    def __init__(self):
+        self._collection = MongoClient(Config.MONGO_URI).EmployeeManagement.rate_limits
+        self._index_ready = False
+
+    def take(self, key, capacity, rate):
+        if not self._index_ready:
+            self._collection.create_index("expires_at", expireAfterSeconds=0)
+            self._index_ready = True
+
+        now = time.time()
+        refilled = {"$min": [capacity, {"$add": [
+            {"$ifNull": ["$tokens", capacity]},
+            {"$multiply": [{"$subtract": [now, {"$ifNull": ["$ts", now]}]}, rate]}
+        ]}]}
+        doc = self._collection.find_one_and_update(
+            {"_id": key},
+            [
+                {"$set": {"tokens": refilled, "ts": now}},
+                {"$set": {
+                    "allowed": {"$gte": ["$tokens", 1]},
+                    "tokens": {"$cond": [{"$gte": ["$tokens", 1]}, {"$subtract": ["$tokens", 1]}, "$tokens"]},
+                    # A bucket idle long enough to refill completely can be dropped
+                    "expires_at": datetime.utcnow() + timedelta(seconds=capacity / rate)
+                }}
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        allowed = doc["allowed"]
+        return allowed, 0 if allowed else (1 - doc["tokens"]) / rate
+
+
+_backends = {"memory": MemoryBackend, "mongo": MongoBackend}
+_backend = None
+
+
+def set_backend(backend):
+    """Swap the bucket store, e.g. for a shared backend or a test stand-in."""
+    global _backend
+    _backend = backend
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        _backend = _backends[Config.RATE_LIMIT_BACKEND]()
+    return _backend
+
+
+def _client_key():
+    # Authenticated callers are limited per user, everyone else per IP
+    try:
+        identity = get_jwt_identity()
+    except RuntimeError:
+        identity = None
+    return f"user:{identity}" if identity else f"ip:{request.remote_addr}"
+
+
+def _too_many(msg, retry_after, status):
+    return jsonify({"msg": msg}), status, {"Retry-After": str(max(1, math.ceil(retry_after)))}
+
+
+def _take(key, name):
+    requests_allowed, per_seconds = Config.RATE_LIMITS[name]
+    return get_backend().take(key, requests_allowed, requests_allowed / per_seconds)
+
+
+def rate_limited(name, per_field=None):
+    """Apply the Config.RATE_LIMITS[name] token bucket to a view.
+
+    Place below @jwt_required() on protected routes so buckets are per user.
+    With per_field, the JSON body field of that name (e.g. the email being
+    logged into) gets its own bucket too, so attempts against one account
+    spread over many IPs are still capped.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            allowed, retry_after = _take(f"{name}:{_client_key()}", name)
+            if allowed and per_field:
+                data = request.get_json(silent=True)
+                value = data.get(per_field) if isinstance(data, dict) else None
+                if isinstance(value, str) and value.strip():
+                    allowed, retry_after = _take(f"{name}:{per_field}:{value.strip().lower()}", name)
+            if not allowed:
+                return _too_many("Too many requests. Please try again later.", retry_after, 429)
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _queue_wait_ms(header):
+    """Milliseconds since the proxy stamped X-Request-Start, or None.
+
+    Proxies send seconds, milliseconds or microseconds since the epoch,
+    optionally prefixed with "t=".
+    """
+    try:
+        stamp = float(header.strip().removeprefix("t="))
+    except (AttributeError, ValueError):
+        return None
+    if stamp > 1e14:
+        stamp /= 1e6
+    elif stamp > 1e11:
+        stamp /= 1e3
+    return (time.time() - stamp) * 1000
+
+
+def init_rate_limiting(app):
+    """Warn at startup when per-process buckets undercount the real budget."""
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    if Config.RATE_LIMIT_BACKEND == "memory" and workers > 1:
+        app.logger.warning(
+            "RATE_LIMIT_BACKEND=memory with %d workers: each worker keeps its own "
+            "buckets, so every budget is effectively multiplied by %d. Use "
+            "RATE_LIMIT_BACKEND=mongo to share them.", workers, workers
+        )
+
+
+def init_load_shedding(app):
+    """Reject requests with 503 once a worker is overloaded.
+
+    Answering immediately is cheaper than letting requests queue inside
+    gunicorn until they time out. Gevent workers shed on in-flight count;
+    sync workers only ever hold one request, so they shed on how long the
+    request waited in the backlog (Config.MAX_QUEUE_WAIT_MS).
+    """
+    slots = threading.BoundedSemaphore(Config.MAX_CONCURRENT_REQUESTS)
+
+    worker_class = os.getenv("GUNICORN_WORKER_CLASS", "sync")
+    if worker_class not in ("gevent", "eventlet") and not Config.MAX_QUEUE_WAIT_MS:
+        app.logger.warning(
+            "Load shedding is inactive under %s workers: set MAX_QUEUE_WAIT_MS "
+            "(needs X-Request-Start from the proxy) or use gevent workers.", worker_class
+        )
+
+    @app.before_request
+    def acquire_slot():
+        if Config.MAX_QUEUE_WAIT_MS:
+            waited = _queue_wait_ms(request.headers.get("X-Request-Start"))
+            if waited is not None and waited > Config.MAX_QUEUE_WAIT_MS:
+                return _too_many("Server is busy. Please try again later.", Config.LOAD_SHED_RETRY_AFTER, 503)
+        if not slots.acquire(blocking=False):
+            return _too_many("Server is busy. Please try again later.", Config.LOAD_SHED_RETRY_AFTER, 503)
+        g._load_shed_slot = True
+
+    @app.teardown_request
+    def release_slot(exc=None):
+        if g.pop("_load_shed_slot", False):
+            slots.release()